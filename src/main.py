@@ -1,90 +1,220 @@
 #!/usr/bin/env python3
 # RSS-only version for LegiScan feeds; last 24h window; MA-friendly title
-import os, sys, feedparser
+import argparse, asyncio, json, os, sys, aiohttp, feedparser
+from collections import namedtuple
 from datetime import datetime, timedelta, timezone
-from dateutil import tz
-import yaml
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
+from zoneinfo import ZoneInfo
 
 WINDOW_HOURS = int(os.environ.get("WINDOW_HOURS", "24"))
+CACHE_PATH = "reports/.feed_cache.json"
+NY_TZ = ZoneInfo("America/New_York")
+SINCE_UNITS = {
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+}
+
+# Lean per-item record; serialized to a JSON array in the feed cache.
+Item = namedtuple("Item", "when when_local title link source")
+CACHE_VERSION = 2
+
+def parse_since(spec):
+    # "24h", "30m", "7d", "1w" -> timedelta; one lookup, no branching.
+    try:
+        return SINCE_UNITS[spec[-1]] * int(spec[:-1])
+    except (IndexError, KeyError, ValueError):
+        raise SystemExit(f"[ERROR] Bad --since value {spec!r}; use e.g. 24h, 30m, 7d")
 
 def iso_boston(dt_utc):
-    return dt_utc.astimezone(tz.gettz("America/New_York")).strftime("%Y-%m-%d %H:%M")
+    return dt_utc.astimezone(NY_TZ).strftime("%Y-%m-%d %H:%M")
 
 def parse_dt(entry):
-    # Prefer published/updated; fall back to structured parsed values
+    # feedparser already parsed the dates into UTC struct_time tuples, so
+    # prefer those and only reparse the raw strings when they are missing.
+    if getattr(entry, "published_parsed", None):
+        return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+    if getattr(entry, "updated_parsed", None):
+        return datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+    # Both parsers below are C-backed fast paths: fromisoformat covers
+    # ISO-8601 (Atom) and parsedate_to_datetime covers RFC-822 (RSS).
     for k in ("published", "updated", "created"):
         if k in entry:
+            s = str(entry[k])
             try:
-                return datetime.fromisoformat(str(entry[k]))
+                return datetime.fromisoformat(s)
+            except Exception:
+                pass
+            try:
+                return parsedate_to_datetime(s)
             except Exception:
                 pass
-    if getattr(entry, "published_parsed", None):
-        return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-    if getattr(entry, "updated_parsed", None):
-        return datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
     return None
 
 def load_feeds(path="src/feeds.yaml"):
+    # feeds.yaml is human-edited but machine-read; keep a parsed JSON cache
+    # keyed on mtime so most runs skip the YAML scanner (and its import).
+    cache_path = path + ".cache.json"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(path, "r") as f:
-        data = yaml.safe_load(f) or {}
-    return data.get("rss", [])
+        data = yaml.load(f, Loader=loader) or {}
+    urls = data.get("rss", [])
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(urls, f)
+    except OSError:
+        pass
+    return urls
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Discard caches written by older layouts rather than misreading them.
+    if data.pop("_v", None) != CACHE_VERSION:
+        return {}
+    return data
+
+def save_cache(cache):
+    os.makedirs("reports", exist_ok=True)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        # Entries hold datetime objects at runtime; encode them on the way out.
+        json.dump({"_v": CACHE_VERSION, **cache}, f,
+                  default=lambda o: o.isoformat(timespec="seconds"))
+
+async def fetch_feed(session, url, cached):
+    # Conditional GET: send the validators from the last run so unchanged
+    # feeds come back as 304 with no body at all.
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    async with session.get(url, headers=headers) as resp:
+        if resp.status == 304:
+            return None
+        resp.raise_for_status()
+        body = await resp.read()
+        return body, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+async def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--since", default=f"{WINDOW_HOURS}h",
+                    help="window size, e.g. 24h, 30m, 7d (default: %(default)s)")
+    args = ap.parse_args()
 
-def main():
     now = datetime.now(timezone.utc)
-    since = now - timedelta(hours=WINDOW_HOURS)
+    since = now - parse_since(args.since)
+    # UTC ISO-8601 strings at fixed precision sort exactly like their
+    # datetimes, so cached entries can be window-filtered without parsing.
+    since_iso = since.isoformat(timespec="seconds")
 
     urls = load_feeds()
     if not urls:
         print("[WARN] No RSS URLs configured in src/feeds.yaml")
         sys.exit(0)
 
+    cache = load_cache()
     items = []
-    for url in urls:
-        fp = feedparser.parse(url)
-        source = (fp.feed.get("title") or url).strip() if getattr(fp, "feed", None) else url
-        for e in fp.entries:
-            dt = parse_dt(e)
-            if not dt:
-                continue
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            dt_utc = dt.astimezone(timezone.utc)
-            if dt_utc < since:
-                continue
-
-            title = (e.get("title") or "").strip() or "(no title)"
-            link = (e.get("link") or "").strip()
-
-            # Optional: only keep things that look like bill introductions.
-            # If your LegiScan feed already scopes to "introduced", you can remove this filter.
-            text_for_filter = f"{title} {(e.get('summary') or '')}".lower()
-            keep = ("introduc" in text_for_filter) or True  # keep all by default
-            if not keep:
-                continue
-
-            items.append({
-                "when": dt_utc,
-                "title": title,
-                "link": link,
-                "source": source
-            })
-
-    items.sort(key=lambda x: x["when"], reverse=True)
-
-    date_title = datetime.now(tz=tz.gettz("America/New_York")).strftime("%Y-%m-%d")
-    lines = [f"# Massachusetts Bills Introduced — {date_title}", ""]
+    # Fetching is pure network I/O, so download the feeds concurrently on the
+    # event loop and hand the raw bytes to feedparser afterwards.
+    connector = aiohttp.TCPConnector(limit=32)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *(fetch_feed(session, url, cache.get(url, {})) for url in urls),
+            return_exceptions=True,
+        )
+
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(f"[WARN] Failed to fetch {url}: {result}")
+            continue
+        if result is None:
+            # 304 Not Modified: nothing moved over the wire, reuse the
+            # entries parsed on the previous run. Filter on the stored ISO
+            # string first and only rehydrate the survivors, leaving the
+            # cached list untouched for the next save.
+            entries = [
+                Item(datetime.fromisoformat(e[0]), e[1], e[2], e[3], sys.intern(e[4]))
+                for e in cache.get(url, {}).get("entries", [])
+                if e[0] >= since_iso
+            ]
+        else:
+            body, etag, modified = result
+            # We only read titles, links, and dates, so skip feedparser's
+            # HTML sanitizer and relative-URI resolution passes.
+            fp = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+            # One interned source string shared by every entry from this feed.
+            source = sys.intern((fp.feed.get("title") or url).strip() if getattr(fp, "feed", None) else url)
+            entries = []
+            for e in fp.entries:
+                dt = parse_dt(e)
+                if not dt:
+                    continue
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                dt_utc = dt.astimezone(timezone.utc)
+
+                title = (e.get("title") or "").strip() or "(no title)"
+                link = (e.get("link") or "").strip()
+
+                # Optional: only keep things that look like bill introductions.
+                # If your LegiScan feed already scopes to "introduced", you can remove this filter.
+                text_for_filter = f"{title} {(e.get('summary') or '')}".lower()
+                keep = ("introduc" in text_for_filter) or True  # keep all by default
+                if not keep:
+                    continue
+
+                entries.append(Item(dt_utc, iso_boston(dt_utc), title, link, source))
+            cache[url] = {"etag": etag, "modified": modified, "entries": entries}
+
+        items.extend(it for it in entries if it.when >= since)
+
+    save_cache(cache)
+
+    # The same release can show up in more than one feed; drop repeats on
+    # (link, when) with an O(1) seen-set before sorting.
+    seen = set()
+    deduped = []
+    for it in items:
+        key = (it.link, it.when)
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(it)
+    items = deduped
+
+    items.sort(key=attrgetter("when"), reverse=True)
+
+    date_title = datetime.now(tz=NY_TZ).strftime("%Y-%m-%d")
+    # Accumulate encoded lines straight into one growable buffer — no
+    # intermediate list of lines, no join copy — then write it in one go.
+    buf = bytearray()
+    append = buf.extend
+    append(f"# Massachusetts Bills Introduced — {date_title}\n\n".encode("utf-8"))
     if not items:
-        lines.append("> No new items found in the last 24 hours.")
+        append(b"> No new items found in the last 24 hours.\n")
     else:
         for it in items:
-            lines.append(f"- **{iso_boston(it['when'])}** — [{it['title']}]({it['link']})  _{it['source']}_")
-    lines.append("")
+            append(f"- **{it.when_local}** — [{it.title}]({it.link})  _{it.source}_\n".encode("utf-8"))
 
     os.makedirs("reports", exist_ok=True)
     out_path = f"reports/{date_title}.md"
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    with open(out_path, "wb") as f:
+        f.write(buf)
     print(f"Wrote {out_path} with {len(items)} items.")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())